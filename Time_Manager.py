@@ -9,21 +9,57 @@ Features:
 - Search & filter by status / priority / date
 - Pomodoro-style timer (configurable work/break lengths)
 - Progress bar showing completed tasks ratio
-- Notifications via messagebox and system beep
+- Timer notifications via a self-closing popup and system beep
 """
 
 import json
 import csv
 import os
 import threading
-from dataclasses import dataclass, asdict
-from datetime import datetime, date
+import hashlib
+import bisect
+import time
+from operator import attrgetter
+from functools import lru_cache
+from dataclasses import dataclass, field, replace
+from datetime import date
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 
+try:
+    import orjson  # optional, much faster serializer
+except ImportError:
+    orjson = None
+
 APP_DATA_FILE = "tasks.json"
+SAVE_DELAY_MS = 500  # debounce window for autosave
+SEARCH_DELAY_MS = 120  # debounce window for search-as-you-type
+TIMER_TICK_MS = 200  # how often the timer checks its deadline
+PAGE_SIZE = 200  # rows added to the tree per page
+SCROLL_LOAD_AT = 0.9  # scroll fraction that triggers loading the next page
+NOTIFY_MS = 5000  # how long the timer-finished notice stays up
+
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _fmt(secs: int, mode: str) -> str:
+    # domain is tiny (at most 120 min of seconds x 2 modes), so cache every string
+    m, s = divmod(secs, 60)
+    return f"{m:02d}:{s:02d}  ({mode})"
+
 
-@dataclass
+def _loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@dataclass(slots=True)
 class Task:
     id: int
     title: str
@@ -32,6 +68,8 @@ class Task:
     priority: str  # Low, Medium, High
     est_minutes: int
     status: str  # Todo, In Progress, Done
+    # parsed form of due, filled in by TaskManagerApp._index_task
+    _due_date: date | None = field(default=None, init=False, repr=False, compare=False)
 
 
 class TaskManagerApp(ttk.Frame):
@@ -52,11 +90,43 @@ class TaskManagerApp(ttk.Frame):
         self.break_minutes = 5
         self.timer_seconds_left = self.work_minutes * 60
         self.timer_job = None
+        self._deadline = 0.0  # time.monotonic() at which the running timer ends
+        self._remaining = None  # exact seconds left while paused; None when not paused
+        self._last_label_text = ""
+
+        # Pending debounced save (after() job id)
+        self._save_job = None
+        self._save_lock = threading.Lock()
+        self._last_save_hash = None  # blake2b of the last bytes written
+        self._save_thread = None
+        # snapshots are numbered so a slow older write can't clobber a newer one
+        self._save_seq = 0
+        self._written_seq = 0
+
+        # Rows currently shown in the tree, used to diff refreshes
+        self._visible_ids: set[int] = set()
+        self._row_values: dict[int, tuple] = {}
+        self._row_order: list[int] = []
+        self._refresh_job = None
+        # Lazy paging of matching rows into the tree
+        self._row_limit = PAGE_SIZE
+        self._match_count = 0
+        self._last_query = ("", "All")
+
+        # Search/sort indexes, kept in step with self.tasks by _index_task
+        self._title_lc: dict[int, str] = {}
+        self._notes_lc: dict[int, str] = {}
+        self._sort_keys: dict[int, tuple] = {}
+        self._order: list[tuple] = []  # sorted (status, due, id)
+        self._by_status: dict[str, set[int]] = {"Todo": set(), "In Progress": set(), "Done": set()}
+
+        self._loaded = False
 
         self._build_ui()
-        self.load_tasks()
-        self._refresh_tree()
+        self.parent.protocol("WM_DELETE_WINDOW", self._on_close)
         self._update_progress()
+        # show the window right away; tasks are filled in once parsed
+        self.load_tasks()
 
     def _build_ui(self):
         # Top controls frame
@@ -79,7 +149,7 @@ class TaskManagerApp(ttk.Frame):
         self.search_var = tk.StringVar()
         search_entry = ttk.Entry(top, textvariable=self.search_var)
         search_entry.pack(side=tk.LEFT, padx=(6, 0))
-        search_entry.bind("<KeyRelease>", lambda e: self._refresh_tree())
+        search_entry.bind("<KeyRelease>", lambda e: self._request_refresh())
 
         ttk.Label(top, text="Filter:").pack(side=tk.LEFT, padx=(12, 0))
         self.filter_var = tk.StringVar(value="All")
@@ -104,9 +174,9 @@ class TaskManagerApp(ttk.Frame):
         self.tree.pack(fill=tk.BOTH, expand=True, side=tk.LEFT)
         self.tree.bind("<<TreeviewSelect>>", lambda e: self._show_details())
 
-        tree_scroll = ttk.Scrollbar(tree_frame, command=self.tree.yview)
-        tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        self.tree.configure(yscrollcommand=tree_scroll.set)
+        self.tree_scroll = ttk.Scrollbar(tree_frame, command=self.tree.yview)
+        self.tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.configure(yscrollcommand=self._on_tree_scroll)
 
         # Right panel
         right = ttk.Frame(main, width=320)
@@ -128,7 +198,8 @@ class TaskManagerApp(ttk.Frame):
         timer_frame = ttk.Frame(right)
         timer_frame.pack(fill=tk.X, pady=(4,0))
 
-        self.timer_label = ttk.Label(timer_frame, text=self._format_time(self.timer_seconds_left), font=(None, 18))
+        self._last_label_text = self._format_time(self.timer_seconds_left)
+        self.timer_label = ttk.Label(timer_frame, text=self._last_label_text, font=(None, 18))
         self.timer_label.pack()
 
         control_frame = ttk.Frame(right)
@@ -164,12 +235,11 @@ class TaskManagerApp(ttk.Frame):
         if not self.timer_running:
             self.timer_mode = "Work"
             self.timer_seconds_left = self.work_minutes * 60
+            self._remaining = None
             self._update_timer_label()
 
     def _format_time(self, secs: int) -> str:
-        m = secs // 60
-        s = secs % 60
-        return f"{m:02d}:{s:02d}  ({self.timer_mode})"
+        return _fmt(secs, self.timer_mode)
 
     def _start_timer(self):
         if not self.timer_running:
@@ -177,22 +247,37 @@ class TaskManagerApp(ttk.Frame):
             # ensure seconds align with mode
             if self.timer_seconds_left <= 0:
                 self.timer_seconds_left = (self.work_minutes if self.timer_mode=="Work" else self.break_minutes) * 60
-            self._schedule_timer()
+                self._remaining = None
+                self._update_timer_label()
+            # resume from the unrounded time left at pause, if any
+            remaining = self.timer_seconds_left if self._remaining is None else self._remaining
+            self._remaining = None
+            self._deadline = time.monotonic() + remaining
+            self.timer_job = self.after(TIMER_TICK_MS, self._schedule_timer)
             self.status_var.set("Timer running")
 
     def _schedule_timer(self):
-        self._update_timer_label()
-        if self.timer_running:
-            self.timer_seconds_left -= 1
-            if self.timer_seconds_left < 0:
-                # switch mode
-                self._on_timer_finish()
-                return
-            self.timer_job = self.after(1000, self._schedule_timer)
+        self.timer_job = None
+        if not self.timer_running:
+            return
+        # derive remaining time from the deadline so late ticks don't accumulate drift
+        remaining = max(0, int(round(self._deadline - time.monotonic())))
+        if remaining != self.timer_seconds_left:
+            self.timer_seconds_left = remaining
+            self._update_timer_label()
+        if remaining == 0:
+            # switch mode
+            self._on_timer_finish()
+            return
+        self.timer_job = self.after(TIMER_TICK_MS, self._schedule_timer)
 
     def _pause_timer(self):
         if self.timer_running:
             self.timer_running = False
+            # keep the exact remainder; round only for display
+            self._remaining = max(0.0, self._deadline - time.monotonic())
+            self.timer_seconds_left = int(round(self._remaining))
+            self._update_timer_label()
             if self.timer_job:
                 self.after_cancel(self.timer_job)
                 self.timer_job = None
@@ -205,19 +290,28 @@ class TaskManagerApp(ttk.Frame):
             self.timer_job = None
         self.timer_mode = "Work"
         self.timer_seconds_left = self.work_minutes * 60
+        self._remaining = None
         self._update_timer_label()
         self.status_var.set("Timer reset")
 
     def _update_timer_label(self):
-        self.timer_label.config(text=self._format_time(self.timer_seconds_left))
+        # repainting the label is the costly part, so skip it when nothing changed
+        text = self._format_time(self.timer_seconds_left)
+        if text != self._last_label_text:
+            self.timer_label.config(text=text)
+            self._last_label_text = text
 
     def _on_timer_finish(self):
-        # beep and show message
+        # beep and show a non-modal notice so the event loop keeps running
         try:
             self.bell()
         except Exception:
             pass
-        messagebox.showinfo("Timer", f"{self.timer_mode} finished!")
+        win = tk.Toplevel(self)
+        win.title("Timer")
+        win.transient(self.parent)
+        ttk.Label(win, text=f"{self.timer_mode} finished!").pack(padx=20, pady=20)
+        win.after(NOTIFY_MS, win.destroy)
         # toggle
         if self.timer_mode == "Work":
             self.timer_mode = "Break"
@@ -231,16 +325,16 @@ class TaskManagerApp(ttk.Frame):
 
     # Task operations
     def _on_add(self):
+        if not self._loaded:
+            self.status_var.set("Still loading tasks...")
+            return
         dlg = TaskDialog(self.parent)
         self.parent.wait_window(dlg.top)
         if dlg.result:
             t = dlg.result
             t.id = self._next_id
             self._next_id += 1
-            self.tasks[t.id] = t
-            self._save_tasks()
-            self._refresh_tree()
-            self._update_progress()
+            self._apply_change(t.id, t)
             self.status_var.set("Task added")
 
     def _on_edit(self):
@@ -254,10 +348,7 @@ class TaskManagerApp(ttk.Frame):
         if dlg.result:
             updated = dlg.result
             updated.id = sel
-            self.tasks[sel] = updated
-            self._save_tasks()
-            self._refresh_tree()
-            self._update_progress()
+            self._apply_change(sel, updated)
             self.status_var.set("Task updated")
 
     def _on_delete(self):
@@ -266,10 +357,7 @@ class TaskManagerApp(ttk.Frame):
             messagebox.showwarning("No selection", "Please select a task to delete.")
             return
         if messagebox.askyesno("Confirm", "Delete selected task?"):
-            del self.tasks[sel]
-            self._save_tasks()
-            self._refresh_tree()
-            self._update_progress()
+            self._apply_change(sel, None)
             self.status_var.set("Task deleted")
 
     def _mark_done(self):
@@ -277,33 +365,37 @@ class TaskManagerApp(ttk.Frame):
         if sel is None:
             messagebox.showwarning("No selection", "Please select a task.")
             return
-        self.tasks[sel].status = "Done"
+        self._apply_change(sel, replace(self.tasks[sel], status="Done"))
+        self.status_var.set("Task marked done")
+
+    def _apply_change(self, tid: int, task: Task | None):
+        # install (or, with None, remove) a task and patch only its row
+        q, filt = self._last_query  # the view currently on screen
+        was_shown = tid in self.tasks and self._in_view(tid, q, filt)
+        if tid in self.tasks:
+            self._unindex_task(tid)
+            del self.tasks[tid]
+        if task is not None:
+            self.tasks[tid] = task
+            self._index_task(task)
+        shown = task is not None and self._in_view(tid, q, filt)
+        self._match_count += shown - was_shown
+        self._patch_row(tid, shown)
         self._save_tasks()
-        self._refresh_tree()
         self._update_progress()
-        self.status_var.set("Task marked done")
+        # a row updated in place keeps its selection without firing <<TreeviewSelect>>
+        if tid == self._selected_task_id():
+            self._show_details()
 
     def _selected_task_id(self):
+        # row iids are the task ids
         sel = self.tree.selection()
-        if not sel:
-            return None
-        item = sel[0]
-        tid = int(self.tree.set(item, "#0") or 0)
-        # we will also store id in iid
-        try:
-            return int(item)
-        except Exception:
-            return None
+        return int(sel[0]) if sel else None
 
     def _show_details(self):
         self.details_text.configure(state=tk.NORMAL)
         self.details_text.delete("1.0", tk.END)
-        sel = self.tree.selection()
-        if not sel:
-            self.details_text.configure(state=tk.DISABLED)
-            return
-        iid = sel[0]
-        tid = int(iid)
+        tid = self._selected_task_id()
         task = self.tasks.get(tid)
         if not task:
             self.details_text.configure(state=tk.DISABLED)
@@ -312,25 +404,170 @@ class TaskManagerApp(ttk.Frame):
         self.details_text.insert(tk.END, s)
         self.details_text.configure(state=tk.DISABLED)
 
+    def _request_refresh(self):
+        # don't refilter on every keystroke while the user is still typing
+        if self._refresh_job:
+            self.after_cancel(self._refresh_job)
+        self._refresh_job = self.after(SEARCH_DELAY_MS, self._refresh_tree)
+
     def _refresh_tree(self):
+        if self._refresh_job:
+            self.after_cancel(self._refresh_job)
+            self._refresh_job = None
         q = self.search_var.get().lower().strip()
         filt = self.filter_var.get()
-        for r in self.tree.get_children():
-            self.tree.delete(r)
-        for tid, t in sorted(self.tasks.items(), key=lambda x: (x[1].status, x[1].due or "")):
-            if filt != "All" and t.status != filt:
-                continue
-            if q and q not in t.title.lower() and q not in t.notes.lower():
-                continue
-            iid = str(tid)
-            self.tree.insert("", tk.END, iid, values=(t.title, t.due or "", t.priority, t.est_minutes, t.status))
+        if filt == "All":
+            candidates = self._order
+        else:
+            # _order is sorted by status first, so each bucket is a contiguous run
+            lo = bisect.bisect_left(self._order, (filt,))
+            candidates = self._order[lo:lo + len(self._by_status.get(filt, ()))]
+        if q:
+            title_lc = self._title_lc
+            notes_lc = self._notes_lc
+            target_order = [tid for _, _, tid in candidates if q in title_lc[tid] or q in notes_lc[tid]]
+        else:
+            target_order = [tid for _, _, tid in candidates]
+        # only materialize the first pages; more are added as the user scrolls
+        if (q, filt) != self._last_query:
+            self._last_query = (q, filt)
+            self._row_limit = PAGE_SIZE
+        self._match_count = len(target_order)
+        target_order = target_order[:self._row_limit]
+        target = set(target_order)
+
+        # only touch the rows that actually changed
+        gone = self._visible_ids - target
+        if gone:
+            self.tree.delete(*map(str, gone))
+            for tid in gone:
+                del self._row_values[tid]
+        if not self._row_values:
+            self._populate_tree(target_order)
+        else:
+            order = [tid for tid in self._row_order if tid in target]
+            # hoist attribute lookups out of the per-row loop
+            tasks = self.tasks
+            row_values = self._row_values
+            tree_values = self._tree_values
+            tree_insert = self.tree.insert
+            tree_item = self.tree.item
+            tree_move = self.tree.move
+            for idx, tid in enumerate(target_order):
+                iid = str(tid)
+                values = tree_values(tasks[tid])
+                old = row_values.get(tid)
+                if old is None:
+                    tree_insert("", idx, iid, values=values)
+                    order.insert(idx, tid)
+                else:
+                    if old != values:
+                        tree_item(iid, values=values)
+                    if order[idx] != tid:
+                        tree_move(iid, "", idx)
+                        order.remove(tid)
+                        order.insert(idx, tid)
+                row_values[tid] = values
+            self._row_order = order
+        self._visible_ids = target
+
+    def _in_view(self, tid: int, q: str, filt: str) -> bool:
+        if filt != "All" and self.tasks[tid].status != filt:
+            return False
+        return not q or q in self._title_lc[tid] or q in self._notes_lc[tid]
+
+    def _patch_row(self, tid: int, shown: bool):
+        # single-row version of the diff in _refresh_tree
+        iid = str(tid)
+        order = self._row_order
+        old_pos = None
+        if tid in self._row_values:
+            old_pos = order.index(tid)
+            del order[old_pos]
+        if shown:
+            idx = bisect.bisect_left(order, self._sort_keys[tid], key=self._sort_keys.__getitem__)
+            # past the last loaded row with more matches still unloaded: it
+            # belongs on a later page, so leave it for scrolling to bring in
+            if idx == len(order) and self._match_count > len(order) + 1:
+                shown = False
+        if not shown:
+            if old_pos is not None:
+                self.tree.delete(iid)
+                del self._row_values[tid]
+                self._visible_ids.discard(tid)
+            return
+        values = self._tree_values(self.tasks[tid])
+        if old_pos is None:
+            self.tree.insert("", idx, iid, values=values)
+            self._visible_ids.add(tid)
+        else:
+            if self._row_values[tid] != values:
+                self.tree.item(iid, values=values)
+            if idx != old_pos:
+                # detach first so the target index doesn't count the row itself
+                self.tree.detach(iid)
+                self.tree.move(iid, "", idx)
+        order.insert(idx, tid)
+        self._row_values[tid] = values
+        if len(order) > self._row_limit:
+            # keep the loaded page at its size
+            last = order.pop()
+            self.tree.delete(str(last))
+            del self._row_values[last]
+            self._visible_ids.discard(last)
+
+    def _on_tree_scroll(self, first, last):
+        self.tree_scroll.set(first, last)
+        # near the bottom (or everything fits): load the next page
+        if float(last) >= SCROLL_LOAD_AT and len(self._row_order) < self._match_count and not self._refresh_job:
+            self._row_limit += PAGE_SIZE
+            self._refresh_job = self.after_idle(self._refresh_tree)
+
+    def _populate_tree(self, tids):
+        # bulk fill of an empty tree (e.g. first load): nothing to diff, so
+        # append rows through the raw Tcl command and skip Treeview.insert's
+        # per-row option formatting
+        call = self.tree.tk.call
+        w = str(self.tree)
+        tasks = self.tasks
+        row_values = self._row_values
+        tree_values = self._tree_values
+        for tid in tids:
+            values = tree_values(tasks[tid])
+            call(w, "insert", "", "end", "-id", tid, "-values", values)
+            row_values[tid] = values
+        self._row_order = list(tids)
+
+    @staticmethod
+    def _tree_values(t: Task) -> tuple:
+        return (t.title, t.due or "", t.priority, t.est_minutes, t.status)
+
+    def _index_task(self, t: Task):
+        try:
+            t._due_date = date.fromisoformat(t.due) if t.due else None
+        except ValueError:
+            t._due_date = None
+        self._title_lc[t.id] = t.title.lower()
+        self._notes_lc[t.id] = t.notes.lower()
+        key = (t.status, t.due or "", t.id)
+        self._sort_keys[t.id] = key
+        bisect.insort(self._order, key)
+        self._by_status.setdefault(t.status, set()).add(t.id)
+
+    def _unindex_task(self, tid: int):
+        # call before mutating or removing the task
+        key = self._sort_keys.pop(tid)
+        del self._order[bisect.bisect_left(self._order, key)]
+        self._by_status[key[0]].discard(tid)
+        del self._title_lc[tid]
+        del self._notes_lc[tid]
 
     def _update_progress(self):
         if not self.tasks:
             self.progress['value'] = 0
             return
         total = len(self.tasks)
-        done = sum(1 for t in self.tasks.values() if t.status == "Done")
+        done = len(self._by_status.get("Done", ()))
         pct = int((done/total) * 100)
         self.progress['value'] = pct
         self.status_var.set(f"{done}/{total} tasks done ({pct}%)")
@@ -338,34 +575,107 @@ class TaskManagerApp(ttk.Frame):
     # Persistence
     def load_tasks(self):
         if not os.path.exists(APP_DATA_FILE):
+            self._loaded = True
             return
+        self.status_var.set("Loading tasks...")
+        threading.Thread(target=self._load_worker, daemon=True).start()
+
+    def _load_worker(self):
         try:
-            with open(APP_DATA_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            for item in data:
-                t = Task(**item)
-                self.tasks[t.id] = t
-                self._next_id = max(self._next_id, t.id + 1)
+            with open(APP_DATA_FILE, "rb") as f:
+                data = _loads(f.read())
+            tasks = [Task(**item) for item in data]
         except Exception as e:
-            messagebox.showerror("Load Error", f"Failed to load tasks: {e}")
+            self.after(0, self._on_load_error, e)
+            return
+        self.after(0, self._apply_loaded, tasks)
+
+    def _apply_loaded(self, tasks):
+        for t in tasks:
+            # a repeated id replaces the earlier entry, as the old loader did
+            if t.id in self.tasks:
+                self._unindex_task(t.id)
+            self.tasks[t.id] = t
+            self._index_task(t)
+            self._next_id = max(self._next_id, t.id + 1)
+        self._loaded = True
+        self._refresh_tree()
+        self._update_progress()
+
+    def _on_load_error(self, e):
+        self._loaded = True
+        messagebox.showerror("Load Error", f"Failed to load tasks: {e}")
 
     def _save_tasks(self):
+        self._request_save()
+
+    def _request_save(self):
+        # coalesce bursts of changes into a single write
+        if self._save_job:
+            self.after_cancel(self._save_job)
+        self._save_job = self.after(SAVE_DELAY_MS, self._flush_save)
+
+    def _flush_save(self, background=True):
+        self._save_job = None
+        # snapshot on the Tk thread; the worker only touches plain data
+        # Task fields are flat primitives, so skip asdict()'s deep copy
+        payload = [{"id": t.id, "title": t.title, "notes": t.notes, "due": t.due, "priority": t.priority,
+                    "est_minutes": t.est_minutes, "status": t.status} for t in self.tasks.values()]
+        self._save_seq += 1
+        if background:
+            self._save_thread = threading.Thread(target=self._write_tasks, args=(payload, self._save_seq), daemon=True)
+            self._save_thread.start()
+        else:
+            self._write_tasks(payload, self._save_seq)
+
+    def _write_tasks(self, payload, seq):
+        tmp = APP_DATA_FILE + ".tmp"
         try:
-            with open(APP_DATA_FILE, "w", encoding="utf-8") as f:
-                json.dump([asdict(t) for t in self.tasks.values()], f, ensure_ascii=False, indent=2)
+            data = _dumps(payload)
+            digest = hashlib.blake2b(data, digest_size=8).digest()
+            with self._save_lock:
+                # a newer snapshot is already on disk
+                if seq < self._written_seq:
+                    return
+                # nothing changed since the last write
+                if digest != self._last_save_hash:
+                    with open(tmp, "wb") as f:
+                        f.write(data)
+                    os.replace(tmp, APP_DATA_FILE)
+                    self._last_save_hash = digest
+                self._written_seq = seq
         except Exception as e:
-            messagebox.showerror("Save Error", f"Failed to save tasks: {e}")
+            msg = f"Failed to save tasks: {e}"
+            if threading.current_thread() is threading.main_thread():
+                messagebox.showerror("Save Error", msg)
+            else:
+                self.after(0, messagebox.showerror, "Save Error", msg)
+
+    def _on_close(self):
+        # drop pending timer/search callbacks so they can't fire into destroyed widgets
+        for job in (self.timer_job, self._refresh_job):
+            if job:
+                self.after_cancel(job)
+        self.timer_job = self._refresh_job = None
+        # let the newest background write finish; older ones are dropped by seq
+        if self._save_thread:
+            self._save_thread.join()
+        if self._save_job:
+            self.after_cancel(self._save_job)
+            self._flush_save(background=False)
+        self.parent.destroy()
 
     def _export_csv(self):
         path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files","*.csv")])
         if not path:
             return
         try:
-            with open(path, "w", newline='', encoding="utf-8") as f:
+            fields = ("id","title","notes","due","priority","est_minutes","status")
+            get = attrgetter(*fields)
+            with open(path, "w", newline='', encoding="utf-8", buffering=1 << 20) as f:
                 w = csv.writer(f)
-                w.writerow(["id","title","notes","due","priority","est_minutes","status"])
-                for t in self.tasks.values():
-                    w.writerow([t.id, t.title, t.notes, t.due, t.priority, t.est_minutes, t.status])
+                w.writerow(fields)
+                w.writerows(get(t) for t in self.tasks.values())
             messagebox.showinfo("Exported", f"Exported {len(self.tasks)} tasks to {path}")
         except Exception as e:
             messagebox.showerror("Export Error", str(e))
@@ -425,9 +735,9 @@ class TaskDialog:
         due = self.due_var.get().strip()
         if due:
             try:
-                # validate iso date
-                datetime.strptime(due, "%Y-%m-%d")
-            except Exception:
+                # validate iso date and store it in canonical YYYY-MM-DD form
+                due = date.fromisoformat(due).isoformat()
+            except ValueError:
                 messagebox.showwarning("Invalid", "Due date must be YYYY-MM-DD")
                 return
         notes = self.notes_text.get("1.0", tk.END).strip()